@@ -5,15 +5,91 @@ Core functionality for managing AWS EC2 instances with application class tagging
 """
 
 import os
+import re
+import logging
 import sys
+import copy
 import time
+import types
+import random
 import yaml
 import base64
-from typing import Dict, List, Optional
-from functools import wraps
+import itertools
+import shutil
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache, wraps
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError, EndpointConnectionError, ConnectTimeoutError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, EndpointConnectionError, ConnectTimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+class CLIFormatter(logging.Formatter):
+    """Plain message format that marks warnings and errors with their level."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname}: {message}"
+        return message
+
+
+def setup_cli_logging() -> None:
+    """Show SpotMan core log messages as plain CLI output on stdout.
+
+    botocore and other libraries stay at the root WARNING level.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(CLIFormatter('%(message)s'))
+    logging.basicConfig(handlers=[handler])
+    logging.getLogger(__name__).setLevel(logging.INFO)
+
+
+@lru_cache(maxsize=8)
+def _session_for(profile: Optional[str]) -> boto3.Session:
+    """Return a process-wide boto3 Session for an AWS profile.
+
+    Building a Session runs the credential provider chain, so reuse it.
+    """
+    return boto3.Session(profile_name=profile) if profile else boto3.Session()
+
+
+# Shared by every EC2 client: a pool large enough for the parallel region
+# fan-outs, kept-alive connections, and botocore's adaptive (token bucket) retries
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True,
+)
+
+
+@lru_cache(maxsize=32)
+def _client_for(session: boto3.Session, region: str):
+    """Return a cached EC2 client for a session and region."""
+    return session.client('ec2', region_name=region, config=_CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=64)
+def _paginator_for(client, operation: str):
+    """Return a cached paginator for a client operation.
+
+    Keyed by the client itself, so a region switch (which swaps clients)
+    naturally gets its own paginator.
+    """
+    return client.get_paginator(operation)
+
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 
 # AMI filters for supported operating systems
@@ -31,6 +107,7 @@ AMI_FILTERS = {
         'name_pattern': 'CentOS Linux 7 x86_64 HVM EBS *'
     }
 }
+AMI_FILTERS = types.MappingProxyType({sys.intern(k): v for k, v in AMI_FILTERS.items()})
 
 # Spot instance status code interpretations
 SPOT_STATUS_MESSAGES = {
@@ -47,24 +124,58 @@ SPOT_STATUS_MESSAGES = {
     'pending-evaluation': ('⏳', 'Spot request is being evaluated'),
     'pending-fulfillment': ('⏳', 'Waiting for spot capacity'),
 }
+SPOT_STATUS_MESSAGES = types.MappingProxyType(
+    {sys.intern(k): v for k, v in SPOT_STATUS_MESSAGES.items()}
+)
+
+# Status icons: emoji on a terminal, plain ASCII tags when output is piped or logged
+_EMOJI_OUTPUT = sys.stdout.isatty()
+ICON = types.MappingProxyType({
+    name: fancy if _EMOJI_OUTPUT else plain
+    for name, (fancy, plain) in {
+        'ok': ('✅', '[OK]'),
+        'error': ('❌', '[X]'),
+        'warn': ('⚠️', '[!]'),
+        'tip': ('💡', '[TIP]'),
+        'info': ('ℹ️', '[i]'),
+        'hibernated': ('🛏️', '[zz]'),
+        'running': ('🟢', '[up]'),
+        'stopped': ('🔴', '[down]'),
+        'other': ('🟡', '[..]'),
+    }.items()
+})
 
 
 class AWSErrorHandler:
     """Centralized AWS error handling utilities."""
     
-    # AWS error codes that indicate transient issues (should be retried)
-    RETRYABLE_ERRORS = {
+    # AWS error codes that indicate rate limiting (always resolve eventually, retried harder)
+    RATE_LIMIT_ERRORS = frozenset(map(sys.intern, {
         'Throttling',
+        'ThrottlingException',
+        'RequestThrottled',
         'RequestLimitExceeded',
+        'TooManyRequestsException',
+        'ProvisionedThroughputExceededException',
+        'SlowDown'
+    }))
+
+    # AWS error codes that indicate transient issues (should be retried)
+    RETRYABLE_ERRORS = RATE_LIMIT_ERRORS | frozenset(map(sys.intern, {
         'ServiceUnavailable',
         'InternalError',
         'InternalFailure',
-        'ServiceUnavailable',
-        'SlowDown'
-    }
+        'RequestTimeout',
+        'RequestTimeoutException',
+        'PriorRequestNotComplete'
+    }))
+
+    # Retry budget applied to rate-limit errors
+    RATE_LIMIT_MAX_RETRIES = 10
+    RATE_LIMIT_CAP = 60.0
     
     # AWS error codes that indicate permanent failures (should not be retried)
-    PERMANENT_ERRORS = {
+    PERMANENT_ERRORS = frozenset(map(sys.intern, {
         'InvalidParameterValue',
         'InvalidInstanceID.NotFound',
         'InvalidInstanceID.Malformed',
@@ -81,7 +192,7 @@ class AWSErrorHandler:
         'InvalidInstanceType',
         'InvalidAvailabilityZone',
         'InvalidParameterCombination'
-    }
+    }))
     
     @staticmethod
     def should_retry(error_code: str) -> bool:
@@ -93,6 +204,21 @@ class AWSErrorHandler:
         """Determine if an AWS error indicates a permanent failure."""
         return error_code in AWSErrorHandler.PERMANENT_ERRORS
     
+    @staticmethod
+    def classify(error_code: str) -> str:
+        """Classify an AWS error code.
+
+        Returns:
+            One of 'rate_limit', 'transient', 'permanent' or 'unknown'
+        """
+        if error_code in AWSErrorHandler.RATE_LIMIT_ERRORS:
+            return 'rate_limit'
+        if error_code in AWSErrorHandler.RETRYABLE_ERRORS:
+            return 'transient'
+        if error_code in AWSErrorHandler.PERMANENT_ERRORS:
+            return 'permanent'
+        return 'unknown'
+
     @staticmethod
     def handle_aws_error(error: ClientError, operation: str = "AWS operation") -> bool:
         """
@@ -108,41 +234,57 @@ class AWSErrorHandler:
         error_code = error.response.get('Error', {}).get('Code', 'Unknown')
         error_message = error.response.get('Error', {}).get('Message', str(error))
         
-        print(f"AWS Error during {operation}:")
-        print(f"  Error Code: {error_code}")
-        print(f"  Message: {error_message}")
-        
-        if AWSErrorHandler.should_retry(error_code):
-            print(f"  → This is a retryable error. Will retry...")
-            return True
-        elif AWSErrorHandler.is_permanent_error(error_code):
-            print(f"  → This is a permanent error. Will not retry.")
-            return False
-        else:
-            print(f"  → Unknown error type. Will not retry.")
-            return False
+        error_class = AWSErrorHandler.classify(error_code)
+        should_retry = error_class in ('rate_limit', 'transient')
+
+        logger.warning("AWS Error during %s: code=%s msg=%s (%s error, %s)",
+                       operation, error_code, error_message, error_class,
+                       "will retry" if should_retry else "will not retry")
+        return should_retry
     
     @staticmethod
-    def retry_on_aws_error(max_retries: int = 3, delay: float = 1.0):
+    def _backoff(attempt: int, delay: float, cap: float, last_sleep: float, jitter: bool) -> float:
+        """Compute the next retry wait time.
+
+        With jitter, uses AWS-style decorrelated jitter so concurrent callers
+        don't retry in lockstep; otherwise plain capped exponential backoff.
+        """
+        if jitter:
+            return min(cap, random.uniform(delay, last_sleep * 3))
+        return min(cap, delay * (2 ** attempt))
+
+    @staticmethod
+    def retry_on_aws_error(max_retries: int = 3, delay: float = 1.0,
+                           cap: float = 30.0, jitter: bool = True):
         """
         Decorator to automatically retry AWS operations on retryable errors.
         
         Args:
             max_retries: Maximum number of retry attempts
-            delay: Base delay between retries (exponential backoff)
+            delay: Base delay between retries
+            cap: Maximum delay between retries
+            jitter: If True, use decorrelated jitter instead of fixed exponential backoff
         """
         def decorator(func):
             @wraps(func)
             def wrapper(*args, **kwargs):
-                last_error = None
+                last_sleep = delay
+                attempt = 0
                 
-                for attempt in range(max_retries + 1):
+                while True:
                     try:
                         return func(*args, **kwargs)
                     except ClientError as e:
-                        last_error = e
+                        error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                        # Rate limiting always clears eventually, so allow more attempts and longer waits
+                        if AWSErrorHandler.classify(error_code) == 'rate_limit':
+                            retry_limit = max(max_retries, AWSErrorHandler.RATE_LIMIT_MAX_RETRIES)
+                            retry_cap = max(cap, AWSErrorHandler.RATE_LIMIT_CAP)
+                        else:
+                            retry_limit = max_retries
+                            retry_cap = cap
                         
-                        if attempt == max_retries:
+                        if attempt >= retry_limit:
                             # Last attempt failed
                             AWSErrorHandler.handle_aws_error(e, func.__name__)
                             raise
@@ -151,28 +293,30 @@ class AWSErrorHandler:
                             # Permanent error, don't retry
                             raise
                         
-                        # Wait before retry with exponential backoff
-                        wait_time = delay * (2 ** attempt)
-                        print(f"  → Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}...")
+                        # Wait before retry with backoff
+                        wait_time = AWSErrorHandler._backoff(attempt, delay, retry_cap, last_sleep, jitter)
+                        last_sleep = wait_time
+                        logger.debug("Waiting %.1f seconds before retry %d/%d...",
+                                     wait_time, attempt + 1, retry_limit)
                         time.sleep(wait_time)
                     except (NoCredentialsError, EndpointConnectionError, ConnectTimeoutError) as e:
-                        print(f"Network/Credential error during {func.__name__}: {e}")
-                        if attempt == max_retries:
+                        logger.warning("Network/Credential error during %s: %s", func.__name__, e)
+                        if attempt >= max_retries:
                             raise
                         
-                        wait_time = delay * (2 ** attempt)
-                        print(f"  → Waiting {wait_time:.1f} seconds before retry {attempt + 1}/{max_retries}...")
+                        wait_time = AWSErrorHandler._backoff(attempt, delay, cap, last_sleep, jitter)
+                        last_sleep = wait_time
+                        logger.debug("Waiting %.1f seconds before retry %d/%d...",
+                                     wait_time, attempt + 1, max_retries)
                         time.sleep(wait_time)
-                
-                # Should never reach here, but just in case
-                if last_error:
-                    raise last_error
+                    
+                    attempt += 1
                     
             return wrapper
         return decorator
 
 
-class IncludeLoader(yaml.SafeLoader):
+class IncludeLoader(_SafeLoader):
     """YAML loader that supports !include directive for external files."""
 
     def __init__(self, stream):
@@ -194,16 +338,97 @@ class IncludeLoader(yaml.SafeLoader):
             with open(filename, 'r') as f:
                 return f.read()
         except FileNotFoundError:
-            print(f"Warning: Include file not found: {filename}")
+            logger.warning("Include file not found: %s", filename)
             return f"# Include file not found: {filename}"
         except Exception as e:
-            print(f"Warning: Error reading include file {filename}: {e}")
+            logger.warning("Error reading include file %s: %s", filename, e)
             return f"# Error reading include file: {filename}"
 
 # Register the include constructor
 IncludeLoader.add_constructor('!include', IncludeLoader.include)
 
 
+# Parsed YAML files keyed by path -> (mtime, data); a changed mtime invalidates the entry.
+# Note that edits to !include targets alone are not detected.
+_YAML_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+
+def _read_text(path: str) -> str:
+    """Read a whole file in a single read() call and decode it as UTF-8."""
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def _parse_yaml(path: str, loader) -> Any:
+    """Parse a YAML file from one in-memory buffer.
+
+    Equivalent to yaml.load(f, Loader=loader), but relative !include paths
+    are still resolved against the file's directory.
+    """
+    yaml_loader = loader(_read_text(path))
+    yaml_loader._root = os.path.dirname(path)
+    try:
+        return yaml_loader.get_single_data()
+    finally:
+        yaml_loader.dispose()
+
+
+def _load_yaml_cached(path: str, loader, copy_result: bool = True) -> Any:
+    """Load a YAML file, reusing the parsed result while its mtime is unchanged.
+
+    Args:
+        path: Path to the YAML file
+        loader: PyYAML loader class to parse with
+        copy_result: If False, return the shared cached object; callers must
+            treat it as read-only
+
+    Returns:
+        A deep copy of the parsed data, so callers may mutate it freely
+    """
+    mtime = os.path.getmtime(path)
+    cached = _YAML_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _parse_yaml(path, loader))
+        _YAML_CACHE[path] = cached
+    return copy.deepcopy(cached[1]) if copy_result else cached[1]
+
+
+@lru_cache(maxsize=32)
+def _encode_user_data(os_type: str, update_os: bool, user_data: Optional[str]) -> Optional[str]:
+    """Build the final user data script and base64-encode it.
+
+    Memoized so bulk launches from the same profile share the encoded blob.
+
+    Args:
+        os_type: Operating system type, selects the OS update script
+        update_os: Whether to prepend an OS update script
+        user_data: Profile user data script, if any
+
+    Returns:
+        Base64-encoded user data or None
+    """
+    final_user_data = ""
+    if update_os:
+        update_scripts = {
+            'ubuntu': "#!/bin/bash\napt-get update && apt-get upgrade -y\n",
+            'amazon-linux': "#!/bin/bash\nyum update -y\n",
+            'centos': "#!/bin/bash\nyum update -y\n"
+        }
+        final_user_data = update_scripts.get(os_type, "")
+
+    if user_data:
+        final_user_data = user_data if not final_user_data else final_user_data + "\n" + user_data
+
+    if final_user_data:
+        return base64.b64encode(final_user_data.encode()).decode()
+    return None
+
+
+def _chunks(seq: List, size: int = 200) -> List[List]:
+    """Split a sequence into lists of at most size items."""
+    return [seq[i:i + size] for i in range(0, len(seq), size)]
+
+
 class SpotPriceManager:
     """Manages spot pricing queries and capacity scores."""
 
@@ -216,35 +441,43 @@ class SpotPriceManager:
         """
         self.ec2_client = ec2_client
         self.region = region
+        # AZ ID -> AZ name mapping is stable, so cache it for the lifetime of the manager
+        self._az_id_to_name: Dict[str, str] = {}
 
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
-    def get_prices(self, instance_types: List[str], availability_zone: str = None) -> List[Dict]:
+    def get_prices(self, instance_types: List[str],
+                   availability_zone: Union[str, List[str], None] = None) -> List[Dict]:
         """Get current spot prices for specified instance types.
 
         Args:
             instance_types: List of instance types to query (e.g., ['c7i.4xlarge'])
-            availability_zone: Specific AZ to query (optional)
+            availability_zone: Specific AZ, or list of AZs queried concurrently (optional)
 
         Returns:
             List of dicts with instance_type, availability_zone, spot_price, timestamp
         """
+        if isinstance(availability_zone, (list, tuple)):
+            return self._get_prices_for_zones(instance_types, availability_zone)
+
         try:
             params = {
                 'InstanceTypes': instance_types,
                 'ProductDescriptions': ['Linux/UNIX'],
-                'MaxResults': 100
+                # Only prices in effect recently; the price current at StartTime is included
+                'StartTime': datetime.now(timezone.utc) - timedelta(minutes=5)
             }
 
             if availability_zone:
                 params['AvailabilityZone'] = availability_zone
 
-            response = self.ec2_client.describe_spot_price_history(**params)
+            paginator = _paginator_for(self.ec2_client, 'describe_spot_price_history')
+            pages = paginator.paginate(**params, PaginationConfig={'MaxItems': 1000, 'PageSize': 100})
 
-            # Get only the most recent price per instance type per AZ
+            # Keep only the most recent price per instance type per AZ
             latest_prices = {}
-            for item in response.get('SpotPriceHistory', []):
+            for item in itertools.chain.from_iterable(p.get('SpotPriceHistory', []) for p in pages):
                 key = (item['InstanceType'], item['AvailabilityZone'])
-                if key not in latest_prices:
+                current = latest_prices.get(key)
+                if current is None or item['Timestamp'] > current['timestamp']:
                     latest_prices[key] = {
                         'instance_type': item['InstanceType'],
                         'availability_zone': item['AvailabilityZone'],
@@ -255,9 +488,27 @@ class SpotPriceManager:
             return sorted(latest_prices.values(), key=lambda x: (x['instance_type'], x['availability_zone']))
 
         except ClientError as e:
-            print(f"Error getting spot prices: {e}")
+            logger.error("Error getting spot prices: %s", e)
             return []
 
+    def _get_prices_for_zones(self, instance_types: List[str], zones: List[str]) -> List[Dict]:
+        """Query spot prices for several AZs concurrently and merge the results."""
+        if not zones:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(zones))) as pool:
+            results = list(pool.map(lambda zone: self.get_prices(instance_types, zone), zones))
+
+        # Keep the most recent price per instance type per AZ
+        latest_prices = {}
+        for price in itertools.chain.from_iterable(results):
+            key = (price['instance_type'], price['availability_zone'])
+            current = latest_prices.get(key)
+            if current is None or price['timestamp'] > current['timestamp']:
+                latest_prices[key] = price
+
+        return sorted(latest_prices.values(), key=lambda x: (x['instance_type'], x['availability_zone']))
+
     def get_capacity_scores(self, instance_types: List[str], target_capacity: int = 5,
                             single_az: bool = True) -> Dict[str, int]:
         """Get spot placement scores for instance types across availability zones.
@@ -282,20 +533,16 @@ class SpotPriceManager:
 
             response = self.ec2_client.get_spot_placement_scores(**params)
 
+            items = response.get('SpotPlacementScores', [])
+            if single_az:
+                self._resolve_az_names(items)
+
             scores = {}
-            for item in response.get('SpotPlacementScores', []):
+            for item in items:
                 if single_az and 'AvailabilityZoneId' in item:
-                    # Map AZ ID to AZ name
+                    # Map AZ ID to AZ name (falls back to the ID if lookup failed)
                     az_id = item['AvailabilityZoneId']
-                    try:
-                        az_response = self.ec2_client.describe_availability_zones(
-                            ZoneIds=[az_id]
-                        )
-                        if az_response['AvailabilityZones']:
-                            az_name = az_response['AvailabilityZones'][0]['ZoneName']
-                            scores[az_name] = item['Score']
-                    except:
-                        scores[az_id] = item['Score']
+                    scores[self._az_id_to_name.get(az_id, az_id)] = item['Score']
                 elif not single_az and 'Region' in item:
                     scores[item['Region']] = item['Score']
 
@@ -309,10 +556,31 @@ class SpotPriceManager:
         except Exception:
             return {}
 
+    def _resolve_az_names(self, items: List[Dict]) -> None:
+        """Populate the AZ ID -> name cache for any IDs not yet seen.
+
+        Issues at most one describe_availability_zones call for all missing IDs.
+        """
+        missing = {item['AvailabilityZoneId'] for item in items
+                   if 'AvailabilityZoneId' in item} - self._az_id_to_name.keys()
+        if not missing:
+            return
+
+        try:
+            az_response = self.ec2_client.describe_availability_zones(ZoneIds=list(missing))
+            self._az_id_to_name.update(
+                {az['ZoneId']: az['ZoneName'] for az in az_response.get('AvailabilityZones', [])}
+            )
+        except Exception:
+            pass
+
 
 class InstanceResolver:
     """Resolves instance identifiers to instance IDs across regions."""
 
+    # Seconds a resolved name -> (region, instance ID) mapping is reused
+    CACHE_TTL = 30.0
+
     def __init__(self, ec2_client, region: str, regions_config: Dict, session):
         """Initialize instance resolver.
 
@@ -326,6 +594,21 @@ class InstanceResolver:
         self.region = region
         self.regions_config = regions_config
         self.session = session
+        # (identifier, include_terminated) -> (region, instance_id, resolved_at)
+        self._cache: Dict[Tuple[str, bool], Tuple[str, str, float]] = {}
+        # Instance description fetched by the most recent resolve(), if any
+        self.last_instance: Optional[Dict] = None
+
+    @staticmethod
+    def _is_instance_id(identifier: str) -> bool:
+        """Return True if an identifier looks like an instance ID rather than a name."""
+        return identifier.startswith('i-') and len(identifier) >= 10
+
+    def invalidate(self, identifier: str) -> None:
+        """Drop cached resolutions for an identifier (name or instance ID)."""
+        for key, (_, instance_id, _) in list(self._cache.items()):
+            if key[0] == identifier or instance_id == identifier:
+                self._cache.pop(key, None)
 
     def _find_in_region(self, identifier: str, include_terminated: bool = False) -> list:
         """Find instances by name in current region."""
@@ -335,10 +618,11 @@ class InstanceResolver:
                 filters.append({'Name': 'instance-state-name',
                                'Values': ['pending', 'running', 'stopping', 'stopped']})
 
-            response = self.ec2_client.describe_instances(Filters=filters)
+            paginator = _paginator_for(self.ec2_client, 'describe_instances')
             instances = []
-            for reservation in response['Reservations']:
-                instances.extend(reservation['Instances'])
+            for page in paginator.paginate(Filters=filters, PaginationConfig={'PageSize': 1000}):
+                for reservation in page['Reservations']:
+                    instances.extend(reservation['Instances'])
             return instances
         except ClientError:
             return []
@@ -352,12 +636,32 @@ class InstanceResolver:
 
         Returns:
             Instance ID or None if not found. Also updates self.region and
-            self.ec2_client if found in another region.
+            self.ec2_client if found in another region, and sets
+            self.last_instance when the lookup fetched the instance description.
         """
+        self.last_instance = None
+
         # If it looks like an instance ID, return as-is
-        if identifier.startswith('i-') and len(identifier) >= 10:
+        if self._is_instance_id(identifier):
             return identifier
 
+        # Reuse a recent resolution of the same name
+        key = (identifier, include_terminated)
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[2] < self.CACHE_TTL:
+            region, instance_id, _ = cached
+            if region != self.region:
+                self.region = region
+                self.ec2_client = _client_for(self.session, region)
+            return instance_id
+
+        result = self._resolve_uncached(identifier, include_terminated)
+        if result:
+            self._cache[key] = (self.region, result, time.monotonic())
+        return result
+
+    def _resolve_uncached(self, identifier: str, include_terminated: bool) -> Optional[str]:
+        """Search the current region, then all other configured regions."""
         # Search current region first
         instances = self._find_in_region(identifier, include_terminated)
         if instances:
@@ -367,39 +671,181 @@ class InstanceResolver:
         other_regions = [r for r in self.regions_config.get('regions', {}).keys()
                         if r != self.region]
 
+        # Create clients up front: boto3 sessions are not thread-safe, clients are
+        clients = {}
         for region in other_regions:
             try:
-                other_client = self.session.client('ec2', region_name=region)
-                other_resolver = InstanceResolver(other_client, region,
-                                                  self.regions_config, self.session)
-                instances = other_resolver._find_in_region(identifier, include_terminated)
-
-                if instances:
-                    result = self._handle_found_instances(instances, identifier, region)
-                    if result:
-                        # Switch to the region where instance was found
-                        print(f"Found instance '{identifier}' in region {region}")
-                        self.region = region
-                        self.ec2_client = other_client
-                    return result
+                clients[region] = _client_for(self.session, region)
             except Exception:
                 continue
 
-        print(f"No instance found with name: {identifier}")
+        if clients:
+            with ThreadPoolExecutor(max_workers=min(16, len(clients))) as executor:
+                results = list(executor.map(
+                    lambda region: self._search_other_region(region, clients[region],
+                                                             identifier, include_terminated),
+                    clients))
+
+            # Take the first hit in configured order (as resolve_many does), so the
+            # answer doesn't depend on which region responds fastest
+            for region, instances in zip(clients, results):
+                if not instances:
+                    continue
+                result = self._handle_found_instances(instances, identifier, region)
+                if result:
+                    # Switch to the region where instance was found
+                    logger.info("Found instance '%s' in region %s", identifier, region)
+                    self.region = region
+                    self.ec2_client = clients[region]
+                return result
+
+        logger.warning("No instance found with name: %s", identifier)
         return None
 
+    def resolve_many(self, identifiers: List[str],
+                     include_terminated: bool = False) -> Dict[str, Tuple[str, str]]:
+        """Resolve several identifiers at once, without switching region.
+
+        Instance IDs pass through as belonging to the current region. Names
+        are served from the cache when fresh; the rest are looked up with one
+        filtered describe_instances per region covering all of them, first in
+        the current region, then in the other configured regions for any
+        names still missing.
+
+        Args:
+            identifiers: Instance names or IDs
+            include_terminated: If True, also search terminated instances
+
+        Returns:
+            Dict mapping each resolved identifier to (region, instance_id).
+            Names that are missing or ambiguous are left out.
+        """
+        resolved: Dict[str, Tuple[str, str]] = {}
+        names = []
+        now = time.monotonic()
+        for identifier in dict.fromkeys(identifiers):
+            if self._is_instance_id(identifier):
+                resolved[identifier] = (self.region, identifier)
+                continue
+            cached = self._cache.get((identifier, include_terminated))
+            if cached and now - cached[2] < self.CACHE_TTL:
+                resolved[identifier] = (cached[0], cached[1])
+            else:
+                names.append(identifier)
+
+        if not names:
+            return resolved
+
+        found = self._find_names_in_region(self.ec2_client, names, include_terminated)
+        self._accept_found(found, self.region, resolved, include_terminated)
+        missing = [name for name in names if name not in found]
+
+        other_regions = [r for r in self.regions_config.get('regions', {}).keys() if r != self.region]
+        if missing and other_regions:
+            # Create clients up front: boto3 sessions are not thread-safe, clients are
+            clients = {region: _client_for(self.session, region) for region in other_regions}
+            with ThreadPoolExecutor(max_workers=min(16, len(clients))) as executor:
+                results = list(executor.map(
+                    lambda region: self._find_names_in_region(clients[region], missing, include_terminated),
+                    other_regions))
+            # Walk regions in configured order so a name found twice resolves predictably
+            for region, region_found in zip(other_regions, results):
+                region_found = {name: instances for name, instances in region_found.items()
+                                if name in missing}
+                self._accept_found(region_found, region, resolved, include_terminated)
+                missing = [name for name in missing if name not in region_found]
+
+        for name in missing:
+            logger.warning("No instance found with name: %s", name)
+        return resolved
+
+    @staticmethod
+    def _find_names_in_region(ec2_client, names: List[str],
+                              include_terminated: bool) -> Dict[str, List[Dict]]:
+        """Find instances for several names in one region (empty dict on error).
+
+        Names go into a single tag:Name filter, chunked to EC2's 200 values
+        per filter.
+        """
+        state_filter = [] if include_terminated else [
+            {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}
+        ]
+        wanted = set(names)
+        found: Dict[str, List[Dict]] = {}
+        try:
+            paginator = _paginator_for(ec2_client, 'describe_instances')
+            for batch in _chunks(names, 200):
+                filters = [{'Name': 'tag:Name', 'Values': batch}] + state_filter
+                for page in paginator.paginate(Filters=filters, PaginationConfig={'PageSize': 1000}):
+                    for reservation in page['Reservations']:
+                        for instance in reservation['Instances']:
+                            name = next((t['Value'] for t in instance.get('Tags', ())
+                                         if t['Key'] == 'Name'), None)
+                            if name in wanted:
+                                found.setdefault(name, []).append(instance)
+        except ClientError:
+            return {}
+        return found
+
+    def _accept_found(self, found: Dict[str, List[Dict]], region: str,
+                      resolved: Dict[str, Tuple[str, str]], include_terminated: bool) -> None:
+        """Record unambiguous name matches from one region in resolved and the cache."""
+        now = time.monotonic()
+        for name, instances in found.items():
+            if len(instances) == 1:
+                instance_id = instances[0]['InstanceId']
+                resolved[name] = (region, instance_id)
+                self._cache[(name, include_terminated)] = (region, instance_id, now)
+            else:
+                self._warn_duplicates(instances, name, region)
+
+    def _search_other_region(self, region: str, other_client, identifier: str,
+                             include_terminated: bool) -> list:
+        """Find instances by name in another region (empty list on error)."""
+        try:
+            other_resolver = InstanceResolver(other_client, region,
+                                              self.regions_config, self.session)
+            return other_resolver._find_in_region(identifier, include_terminated)
+        except Exception:
+            return []
+
     def _handle_found_instances(self, instances: list, identifier: str,
                                 region: str) -> Optional[str]:
         """Handle search results - return ID or print error for duplicates."""
         if len(instances) == 1:
+            self.last_instance = instances[0]
             return instances[0]['InstanceId']
 
-        print(f"Multiple instances found with name: {identifier}")
-        for inst in instances:
-            print(f"  {inst['InstanceId']} ({inst['State']['Name']}) in {region}")
-        print("Please use the instance ID instead.")
+        self._warn_duplicates(instances, identifier, region)
         return None
 
+    @staticmethod
+    def _warn_duplicates(instances: list, identifier: str, region: str) -> None:
+        """Log that a name matched several instances."""
+        logger.warning("Multiple instances found with name: %s\n%s\nPlease use the instance ID instead.",
+                       identifier,
+                       '\n'.join(f"  {inst['InstanceId']} ({inst['State']['Name']}) in {region}"
+                                 for inst in instances))
+
+
+# Matches one Host block in an SSH config (with its optional SpotMan marker comment),
+# up to the next marker or Host directive. Group 1 is the host alias.
+_SSH_BLOCK_RE = re.compile(
+    r'^(?:# SpotMan managed entry for [^\n]*\n)?'
+    r'Host (\S+)[^\n]*\n?'
+    r'(?:(?!# SpotMan managed entry for |Host )[^\n]*\n?)*',
+    re.M
+)
+
+
+# Fixed head of a SpotMan SSH entry; optional directives follow it
+_SSH_ENTRY_TEMPLATE = (
+    "# SpotMan managed entry for {host} ({instance_id})\n"
+    "Host {host}\n"
+    "    HostName {public_ip}\n"
+    "    User {ssh_user}\n"
+)
+
 
 class SSHConfigManager:
     """Manages SSH configuration for SpotMan instances."""
@@ -408,6 +854,45 @@ class SSHConfigManager:
         self.ssh_dir = os.path.expanduser('~/.ssh')
         self.config_path = os.path.join(self.ssh_dir, 'spotman_config')
         self.main_config_path = os.path.join(self.ssh_dir, 'config')
+        # path -> (st_mtime_ns, content) for files read during this process
+        self._content_cache: Dict[str, Tuple[int, str]] = {}
+
+    def _read_cached(self, path: str) -> str:
+        """Read a file, reusing the previous content if its mtime is unchanged."""
+        st = os.stat(path)
+        cached = self._content_cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        with open(path, 'r') as f:
+            data = f.read()
+        self._content_cache[path] = (st.st_mtime_ns, data)
+        return data
+
+    def _write(self, path: str, content: str, atomic: bool = False) -> None:
+        """Write a file and drop its cached content.
+
+        With atomic=True the content goes to a temporary file that is then
+        renamed over path, so readers never see a half-written file. Only use
+        it for files SpotMan owns, as it replaces symlinks.
+        """
+        self._content_cache.pop(path, None)
+        if not atomic:
+            with open(path, 'w') as f:
+                f.write(content)
+            return
+
+        # A unique temp file per write, so concurrent spotman runs can't clobber each other's
+        f = tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path),
+                                        prefix=f".{os.path.basename(path)}.", delete=False)
+        try:
+            with f:
+                f.write(content)
+            if os.path.exists(path):
+                shutil.copymode(path, f.name)
+            os.replace(f.name, path)
+        except BaseException:
+            os.unlink(f.name)
+            raise
 
     def get_config_path(self) -> str:
         """Get the path to SpotMan's SSH config file."""
@@ -426,28 +911,21 @@ class SSHConfigManager:
         # Check if main config includes SpotMan config
         include_line = f"Include {self.config_path}"
 
+        existing_content = ""
         if os.path.exists(self.main_config_path):
-            with open(self.main_config_path, 'r') as f:
-                content = f.read()
-            if include_line in content:
+            existing_content = self._read_cached(self.main_config_path)
+            if include_line in existing_content:
                 return True
 
         # Add include line to main config
         try:
-            existing_content = ""
-            if os.path.exists(self.main_config_path):
-                with open(self.main_config_path, 'r') as f:
-                    existing_content = f.read()
+            self._write(self.main_config_path, f"{include_line}\n\n{existing_content}")
 
-            with open(self.main_config_path, 'w') as f:
-                f.write(f"{include_line}\n\n")
-                f.write(existing_content)
-
-            print(f"Added SpotMan SSH config include to {self.main_config_path}")
+            logger.info("Added SpotMan SSH config include to %s", self.main_config_path)
             return True
 
         except Exception as e:
-            print(f"Warning: Could not set up SSH config include: {e}")
+            logger.warning("Could not set up SSH config include: %s", e)
             return False
 
     def host_exists(self, host_name: str) -> bool:
@@ -455,9 +933,8 @@ class SSHConfigManager:
         if not os.path.exists(self.config_path):
             return False
         try:
-            with open(self.config_path, 'r') as f:
-                content = f.read()
-            return f"Host {host_name}" in content
+            content = self._read_cached(self.config_path)
+            return bool(re.search(rf'^Host {re.escape(host_name)}[ \t]*$', content, re.M))
         except Exception:
             return False
 
@@ -477,67 +954,80 @@ class SSHConfigManager:
         Returns:
             True if successful
         """
-        self.ensure_setup()
+        return self.add_entries([{
+            'host_name': host_name,
+            'instance_id': instance_id,
+            'public_ip': public_ip,
+            'ssh_user': ssh_user,
+            'identity_file': identity_file,
+            'port_forwards': port_forwards,
+        }])
 
-        # Build SSH config entry
-        lines = [
-            f"# SpotMan managed entry for {host_name} ({instance_id})",
-            f"Host {host_name}",
-            f"    HostName {public_ip}",
-            f"    User {ssh_user}",
-        ]
+    def add_entries(self, entries: List[Dict]) -> bool:
+        """Add SSH config entries for several instances with a single rewrite.
 
-        if identity_file:
-            lines.append(f"    IdentityFile {identity_file}")
+        Existing entries for the same hosts are replaced.
 
-        lines.append("    StrictHostKeyChecking no")
+        Args:
+            entries: add_entry keyword arguments, one dict per instance
 
-        # Add port forwarding rules
-        for forward in (port_forwards or []):
-            local_port = forward.get('local_port')
-            remote_port = forward.get('remote_port')
-            remote_host = forward.get('remote_host', 'localhost')
-            if local_port and remote_port:
-                lines.append(f"    LocalForward {local_port} {remote_host}:{remote_port}")
+        Returns:
+            True if successful
+        """
+        if not entries:
+            return True
+
+        self.ensure_setup()
 
-        ssh_entry = '\n'.join(lines) + '\n'
+        blocks = {entry['host_name']: self._format_entry(**entry) for entry in entries}
 
         try:
             # Read existing config
             existing_config = ""
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    existing_config = f.read()
-
-            # Remove existing entry for this host
-            filtered_lines = []
-            skip_until_next_host = False
-
-            for line in existing_config.split('\n'):
-                if line.startswith('Host '):
-                    skip_until_next_host = (line == f"Host {host_name}")
-                    if not skip_until_next_host:
-                        filtered_lines.append(line)
-                elif line.startswith('# SpotMan managed entry for') and host_name in line:
-                    skip_until_next_host = True
-                elif not skip_until_next_host:
-                    filtered_lines.append(line)
-
-            # Add new entry
-            updated_config = '\n'.join(filtered_lines).rstrip() + '\n\n' + ssh_entry
+                existing_config = self._read_cached(self.config_path)
 
-            with open(self.config_path, 'w') as f:
-                f.write(updated_config)
+            # Replace existing entries for these hosts
+            remaining = _SSH_BLOCK_RE.sub(
+                lambda m: '' if m.group(1) in blocks else m.group(0), existing_config
+            )
+            updated_config = '\n'.join([remaining.rstrip() + '\n', *blocks.values()])
+
+            self._write(self.config_path, updated_config, atomic=True)
 
-            print(f"SSH config updated for {host_name} -> {public_ip}")
-            if port_forwards:
-                print(f"Port forwarding configured: {port_forwards}")
+            for entry in entries:
+                logger.info("SSH config updated for %s -> %s", entry['host_name'], entry['public_ip'])
+                if entry.get('port_forwards'):
+                    logger.info("Port forwarding configured: %s", entry['port_forwards'])
             return True
 
         except Exception as e:
-            print(f"Error updating SSH config: {e}")
+            logger.error("Error updating SSH config: %s", e)
             return False
 
+    @staticmethod
+    def _format_entry(host_name: str, instance_id: str, public_ip: str,
+                      ssh_user: str = 'ubuntu', identity_file: str = None,
+                      port_forwards: List[Dict] = None) -> str:
+        """Build the SSH config block for one instance."""
+        parts = [_SSH_ENTRY_TEMPLATE.format(host=host_name, instance_id=instance_id,
+                                            public_ip=public_ip, ssh_user=ssh_user)]
+
+        if identity_file:
+            parts.append(f"    IdentityFile {identity_file}\n")
+
+        parts.append("    StrictHostKeyChecking no\n")
+
+        # Add port forwarding rules
+        for forward in (port_forwards or []):
+            local_port = forward.get('local_port')
+            remote_port = forward.get('remote_port')
+            remote_host = forward.get('remote_host', 'localhost')
+            if local_port and remote_port:
+                parts.append(f"    LocalForward {local_port} {remote_host}:{remote_port}\n")
+
+        return ''.join(parts)
+
 
 class AWSInstanceManager:
     """Manages AWS EC2 instances with application class tagging."""
@@ -550,26 +1040,46 @@ class AWSInstanceManager:
             profile: AWS profile to use. If None, uses default profile.
             quiet: If True, suppress informational messages.
         """
-        self.session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+        self.session = _session_for(profile)
         self.region = region or self.session.region_name or 'us-east-1'
 
         try:
-            self.ec2_client = self.session.client('ec2', region_name=self.region)
+            self.ec2_client = _client_for(self.session, self.region)
         except Exception as e:
-            print(f"Error initializing AWS clients: {e}")
-            print("Please check your AWS credentials and configuration.")
+            logger.error("Error initializing AWS clients: %s", e)
+            logger.error("Please check your AWS credentials and configuration.")
             sys.exit(1)
 
         # Load configuration files
         self.config = self._load_config()
         self.regions_config = self._load_regions_config()
 
+        # Per-region SSH settings used when writing SSH config entries
+        self._ssh_user_by_region: Dict[str, str] = {
+            region: (region_config or {}).get('ssh_user', 'ubuntu')
+            for region, region_config in self.regions_config.get('regions', {}).items()
+        }
+        self._ssh_keys_map: Dict[str, str] = self.regions_config.get('ssh_keys') or {}
+
         # Initialize helper managers
         self.ssh_config = SSHConfigManager()
         self.spot_prices = SpotPriceManager(self.ec2_client, self.region)
         self.resolver = InstanceResolver(self.ec2_client, self.region,
                                          self.regions_config, self.session)
 
+        # (region, os_type, name_pattern) -> (fetched_at, ami_id)
+        self._ami_cache: Dict[Tuple[str, str, str], Tuple[float, str]] = {}
+        # (region, availability_zone) -> (fetched_at, subnet_id)
+        self._vpc_subnet_cache: Dict[Tuple[str, Optional[str]], Tuple[float, str]] = {}
+        # (region, instance name) -> checked_at, for names recently found to be unused
+        self._unused_names: Dict[Tuple[str, str], float] = {}
+
+        # Background waits for instances created with wait=False, keyed by instance ID
+        self._wait_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_waits: Dict[str, Future] = {}
+        # Serializes SSH config rewrites from concurrent waits
+        self._ssh_lock = threading.Lock()
+
         if not quiet:
             print(f"Using AWS region: {self.region}")
     
@@ -580,10 +1090,9 @@ class AWSInstanceManager:
         
         if os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                return _load_yaml_cached(config_path, _SafeLoader) or {}
             except Exception as e:
-                print(f"Warning: Error loading config: {e}")
+                logger.warning("Error loading config: %s", e)
         
         return {}
     
@@ -594,10 +1103,9 @@ class AWSInstanceManager:
         
         if os.path.exists(regions_path):
             try:
-                with open(regions_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
+                return _load_yaml_cached(regions_path, _SafeLoader) or {}
             except Exception as e:
-                print(f"Warning: Error loading regions config: {e}")
+                logger.warning("Error loading regions config: %s", e)
         
         return {}
     
@@ -614,8 +1122,7 @@ class AWSInstanceManager:
         Raises:
             FileNotFoundError: If profile doesn't exist and required=True
         """
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        profile_path = os.path.join(script_dir, 'profiles', f'{profile_name}.yaml')
+        profile_path = self._profile_path(profile_name)
 
         if not os.path.exists(profile_path):
             if required:
@@ -627,14 +1134,44 @@ class AWSInstanceManager:
             return None
 
         try:
-            with open(profile_path, 'r') as f:
-                return yaml.load(f, Loader=IncludeLoader)
+            return _load_yaml_cached(profile_path, IncludeLoader)
         except Exception as e:
-            print(f"Error loading profile {profile_name}: {e}")
+            logger.error("Error loading profile %s: %s", profile_name, e)
             if required:
                 raise
             return None
     
+    @staticmethod
+    def _profile_path(profile_name: str) -> str:
+        """Return the path of a profile's YAML file."""
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(script_dir, 'profiles', f'{profile_name}.yaml')
+
+    def _profile_setting(self, profile_name: str, key: str, default: Any = None) -> Any:
+        """Read a single profile setting without copying the whole profile.
+
+        Backed by the mtime-keyed YAML cache, so repeated lookups (e.g. one per
+        instance when writing SSH entries) cost a stat rather than a parse and
+        deep copy. The returned value is shared and must not be mutated.
+
+        Args:
+            profile_name: Name of the profile
+            key: Setting to read
+            default: Value returned when the profile or setting is missing
+
+        Returns:
+            The setting value or default
+        """
+        try:
+            profile = _load_yaml_cached(self._profile_path(profile_name), IncludeLoader,
+                                        copy_result=False)
+        except OSError:
+            return default
+        except Exception as e:
+            logger.error("Error loading profile %s: %s", profile_name, e)
+            return default
+        return profile.get(key, default) if isinstance(profile, dict) else default
+
     def list_profiles(self) -> List[str]:
         """List available profiles.
         
@@ -647,14 +1184,14 @@ class AWSInstanceManager:
         if not os.path.exists(profiles_dir):
             return []
         
-        profiles = []
-        for file in os.listdir(profiles_dir):
-            if file.endswith('.yaml') or file.endswith('.yml'):
-                profiles.append(file.rsplit('.', 1)[0])
+        with os.scandir(profiles_dir) as entries:
+            profiles = [entry.name.rsplit('.', 1)[0] for entry in entries
+                        if entry.is_file() and entry.name.endswith(('.yaml', '.yml'))]
         
         return sorted(profiles)
 
-    def get_spot_prices(self, instance_types: List[str], availability_zone: str = None) -> List[Dict]:
+    def get_spot_prices(self, instance_types: List[str],
+                        availability_zone: Union[str, List[str], None] = None) -> List[Dict]:
         """Get current spot prices for specified instance types.
 
         Delegates to SpotPriceManager.
@@ -692,25 +1229,9 @@ class AWSInstanceManager:
         Returns:
             Base64-encoded user data or None
         """
-        os_type = profile.get('os_type', 'ubuntu')
-        update_os = profile.get('update_os', False)
-        user_data = self._get_user_data_script(profile)
-
-        final_user_data = ""
-        if update_os:
-            update_scripts = {
-                'ubuntu': "#!/bin/bash\napt-get update && apt-get upgrade -y\n",
-                'amazon-linux': "#!/bin/bash\nyum update -y\n",
-                'centos': "#!/bin/bash\nyum update -y\n"
-            }
-            final_user_data = update_scripts.get(os_type, "")
-
-        if user_data:
-            final_user_data = user_data if not final_user_data else final_user_data + "\n" + user_data
-
-        if final_user_data:
-            return base64.b64encode(final_user_data.encode()).decode()
-        return None
+        return _encode_user_data(profile.get('os_type', 'ubuntu'),
+                                 bool(profile.get('update_os', False)),
+                                 self._get_user_data_script(profile))
 
     def _prepare_instance_tags(self, profile: Dict, profile_name: str, instance_name: str,
                                app_class: str, spot_instance: bool, hibernation_enabled: bool) -> List[Dict]:
@@ -797,28 +1318,45 @@ class AWSInstanceManager:
 
         return {'MarketType': 'spot', 'SpotOptions': spot_options}
 
-    def _wait_for_instance_and_setup_ssh(self, instance_id: str, instance_name: str) -> None:
+    def _wait_for_instance_and_setup_ssh(self, instance_id: str, instance_name: str,
+                                         ec2_client=None, region: str = None) -> None:
         """Wait for instance to be running and setup SSH config.
 
         Args:
             instance_id: EC2 instance ID
             instance_name: Instance name for SSH host alias
+            ec2_client: Client for the instance's region; defaults to the
+                manager's current client. Background waits pass the client
+                captured at launch so a later region switch can't redirect them.
+            region: Region of ec2_client, defaults to the manager's region
         """
-        print("Waiting for instance to be running...")
-        waiter = self.ec2_client.get_waiter('instance_running')
+        ec2_client = ec2_client or self.ec2_client
+        region = region or self.region
+        logger.info("Waiting for instance to be running...")
+        waiter = ec2_client.get_waiter('instance_running')
+
+        # Poll often so we notice the running state quickly, keeping the ~5 minute total timeout
+        delay = max(1, int(self.regions_config.get('waiter_delay', 3)))
+        max_attempts = -(-300 // delay)
         try:
-            waiter.wait(InstanceIds=[instance_id], WaiterConfig={'Delay': 15, 'MaxAttempts': 20})
-            print("Instance is now running.")
+            waiter.wait(InstanceIds=[instance_id],
+                        WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts})
+            logger.info("Instance is now running.")
+
+            response = ec2_client.describe_instances(InstanceIds=[instance_id])
+            instance = next((i for r in response.get('Reservations', ()) for i in r.get('Instances', ())), None)
+            if instance is None:
+                logger.warning("Instance %s not found. SSH config entry not created.", instance_id)
+                return
 
             host_name = f"spotman-{instance_name}"
-            if self._add_ssh_config_entry(instance_id, host_name):
-                print(f"SSH config updated. Connect with: ssh {host_name}")
+            if self._add_ssh_config_entry(instance_id, host_name, {**instance, 'Region': region}):
+                logger.info("SSH config updated. Connect with: ssh %s", host_name)
 
         except Exception as e:
-            print(f"Warning: Error waiting for instance or updating SSH config: {e}")
-            print(f"Instance {instance_id} was created but may still be starting up.")
+            logger.warning("Error waiting for instance or updating SSH config: %s", e)
+            logger.warning("Instance %s was created but may still be starting up.", instance_id)
     
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
     def _get_latest_ami(self, os_type: str, ami_name_pattern: str = None) -> str:
         """Get the latest AMI ID for the specified OS type.
 
@@ -838,9 +1376,15 @@ class AWSInstanceManager:
         ami_config = AMI_FILTERS[os_type]
         name_pattern = ami_name_pattern or ami_config['name_pattern']
 
+        # AMI listings change rarely, so reuse a recent lookup for this region
+        cache_key = (self.region, os_type, name_pattern)
+        cached = self._ami_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.regions_config.get('ami_cache_ttl', 3600):
+            logger.info("Using latest %s AMI: %s (cached)", os_type, cached[1])
+            return cached[1]
+
         filters = [
             {'Name': 'name', 'Values': [name_pattern]},
-            {'Name': 'owner-id', 'Values': [ami_config['owner_id']]},
             {'Name': 'state', 'Values': ['available']},
             {'Name': 'architecture', 'Values': ['x86_64']},
             {'Name': 'virtualization-type', 'Values': ['hvm']},
@@ -848,20 +1392,23 @@ class AWSInstanceManager:
         ]
 
         try:
-            response = self.ec2_client.describe_images(Filters=filters)
+            paginator = _paginator_for(self.ec2_client, 'describe_images')
+            pages = paginator.paginate(Owners=[ami_config['owner_id']], Filters=filters)
             
-            if not response['Images']:
+            # Pick the latest by creation date (ISO-8601 strings compare chronologically)
+            latest_ami = max((image for page in pages for image in page['Images']),
+                             key=lambda x: x['CreationDate'], default=None)
+            if latest_ami is None:
                 raise ValueError(f"No AMIs found for OS type: {os_type}")
             
-            # Sort by creation date and get the latest
-            latest_ami = sorted(response['Images'], key=lambda x: x['CreationDate'], reverse=True)[0]
             ami_id = latest_ami['ImageId']
             
-            print(f"Using latest {os_type} AMI: {ami_id} ({latest_ami['Name']})")
+            logger.info("Using latest %s AMI: %s (%s)", os_type, ami_id, latest_ami['Name'])
+            self._ami_cache[cache_key] = (time.monotonic(), ami_id)
             return ami_id
             
         except ClientError as e:
-            print(f"Error getting latest AMI for {os_type}: {e}")
+            logger.error("Error getting latest AMI for %s: %s", os_type, e)
             raise
     
     def _get_default_vpc_subnet(self, availability_zone: str = None) -> Optional[str]:
@@ -873,6 +1420,12 @@ class AWSInstanceManager:
         Returns:
             Subnet ID of the default VPC or None if not found
         """
+        # Default VPC topology rarely changes, so reuse a recent lookup
+        cache_key = (self.region, availability_zone)
+        cached = self._vpc_subnet_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.regions_config.get('subnet_cache_ttl', 3600):
+            return cached[1]
+
         try:
             # Get default VPC
             vpcs = self.ec2_client.describe_vpcs(
@@ -895,68 +1448,116 @@ class AWSInstanceManager:
                 return None
 
             # Return the first available subnet
-            return subnets['Subnets'][0]['SubnetId']
+            subnet_id = subnets['Subnets'][0]['SubnetId']
+            self._vpc_subnet_cache[cache_key] = (time.monotonic(), subnet_id)
+            return subnet_id
 
-        except ClientError:
+        except ClientError as e:
+            self._invalidate_subnet_cache(e)
             return None
+
+    def _invalidate_subnet_cache(self, error: ClientError) -> None:
+        """Drop cached subnets for the current region if AWS reports them gone."""
+        error_code = error.response.get('Error', {}).get('Code', '')
+        if error_code in ('InvalidSubnetID.NotFound', 'InvalidVpcID.NotFound'):
+            for key in [k for k in self._vpc_subnet_cache if k[0] == self.region]:
+                del self._vpc_subnet_cache[key]
     
-    def _add_ssh_config_entry(self, instance_id: str, host_name: str) -> bool:
-        """Add SSH config entry for a newly created instance.
+    def _ssh_entry_params(self, instance_id: str, host_name: str,
+                          instance: Optional[Dict] = None) -> Optional[Dict]:
+        """Work out the SSH config entry for an instance.
 
         Args:
             instance_id: EC2 instance ID
             host_name: SSH host alias
+            instance: Current instance description, if the caller already has one
 
         Returns:
-            True if successful, False otherwise
+            SSHConfigManager.add_entry keyword arguments, or None if the
+            instance cannot get an entry
         """
-        try:
+        if instance is None:
             response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            instance = response['Reservations'][0]['Instances'][0]
-            public_ip = instance.get('PublicIpAddress')
-            key_name = instance.get('KeyName')
+            instance = next((i for r in response.get('Reservations', ()) for i in r.get('Instances', ())), None)
+            if instance is None:
+                logger.warning("Instance %s not found. SSH config entry not created.", instance_id)
+                return None
+        public_ip = instance.get('PublicIpAddress')
+        key_name = instance.get('KeyName')
 
-            if not public_ip:
-                print("Warning: Instance has no public IP address. SSH config entry not created.")
-                return False
+        if not public_ip:
+            logger.warning("Instance has no public IP address. SSH config entry not created.")
+            return None
 
-            # Get the SSH user from regions configuration
-            ssh_user = 'ubuntu'
-            if self.regions_config and 'regions' in self.regions_config and self.region in self.regions_config['regions']:
-                region_config = self.regions_config['regions'][self.region]
-                ssh_user = region_config.get('ssh_user', ssh_user)
-
-            # Get the SSH key file path from regions configuration
-            identity_file = None
-            if key_name and self.regions_config and 'ssh_keys' in self.regions_config:
-                ssh_keys = self.regions_config['ssh_keys']
-                if key_name in ssh_keys:
-                    identity_file = ssh_keys[key_name]
-                else:
-                    print(f"Warning: SSH key '{key_name}' not found in regions configuration.")
-
-            # Get port forwarding configuration from profile
-            port_forwards = []
-            for tag in instance.get('Tags', []):
-                if tag['Key'] == 'Profile':
-                    profile = self.get_profile(tag['Value'])
-                    if profile:
-                        port_forwards = profile.get('ssh_port_forwards', [])
-                    break
-
-            return self.ssh_config.add_entry(
-                host_name=host_name,
-                instance_id=instance_id,
-                public_ip=public_ip,
-                ssh_user=ssh_user,
-                identity_file=identity_file,
-                port_forwards=port_forwards
-            )
+        # Get the SSH user from regions configuration
+        ssh_user = self._ssh_user_by_region.get(instance.get('Region', self.region), 'ubuntu')
+
+        # Get the SSH key file path from regions configuration
+        identity_file = None
+        if key_name and self._ssh_keys_map:
+            identity_file = self._ssh_keys_map.get(key_name)
+            if identity_file is None:
+                logger.warning("SSH key '%s' not found in regions configuration.", key_name)
+
+        # Get port forwarding configuration from profile
+        port_forwards = []
+        profile_tag = next((t['Value'] for t in instance.get('Tags', []) if t['Key'] == 'Profile'), None)
+        if profile_tag:
+            port_forwards = self._profile_setting(profile_tag, 'ssh_port_forwards', [])
+
+        return {
+            'host_name': host_name,
+            'instance_id': instance_id,
+            'public_ip': public_ip,
+            'ssh_user': ssh_user,
+            'identity_file': identity_file,
+            'port_forwards': port_forwards,
+        }
+
+    def _add_ssh_config_entry(self, instance_id: str, host_name: str,
+                              instance: Optional[Dict] = None) -> bool:
+        """Add SSH config entry for a newly created instance.
+
+        Args:
+            instance_id: EC2 instance ID
+            host_name: SSH host alias
+            instance: Current instance description, if the caller already has one
 
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            entry = self._ssh_entry_params(instance_id, host_name, instance)
         except ClientError as e:
-            print(f"Error getting instance details for SSH config: {e}")
+            logger.error("Error getting instance details for SSH config: %s", e)
+            return False
+        if entry is None:
             return False
 
+        with self._ssh_lock:
+            return self.ssh_config.add_entry(**entry)
+
+    def _add_ssh_config_entries(self, jobs: List[Tuple[str, str, Optional[Dict]]]) -> bool:
+        """Add SSH config entries for several instances with one config rewrite.
+
+        Entry details are worked out from the already-fetched instance data,
+        then written together.
+
+        Args:
+            jobs: (instance_id, host_name, instance) tuples
+
+        Returns:
+            True if every instance got an entry, False otherwise
+        """
+        if not jobs:
+            return True
+
+        entries = [self._ssh_entry_params(*job) for job in jobs]
+
+        with self._ssh_lock:
+            written = self.ssh_config.add_entries([entry for entry in entries if entry])
+        return written and all(entries)
+
     def _instance_name_exists(self, name: str) -> bool:
         """Check if an instance with the given name already exists.
 
@@ -966,20 +1567,42 @@ class AWSInstanceManager:
         Returns:
             True if an instance with this name exists (not terminated), False otherwise
         """
+        # Skip the lookup for names confirmed unused moments ago
+        cache_key = (self.region, name)
+        checked_at = self._unused_names.get(cache_key)
+        if checked_at and time.monotonic() - checked_at < 30:
+            return False
+
         try:
             filters = [
                 {'Name': 'tag:Name', 'Values': [name]},
                 {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}
             ]
-            response = self.ec2_client.describe_instances(Filters=filters)
-
-            for reservation in response['Reservations']:
-                if reservation['Instances']:
-                    return True
-            return False
+            # EC2 filters after paging, so small pages can come back empty with a
+            # NextToken; use full pages and stop at the first match
+            paginator = _paginator_for(self.ec2_client, 'describe_instances')
+            pages = paginator.paginate(Filters=filters, PaginationConfig={'PageSize': 1000})
+            exists = any(r['Instances'] for page in pages for r in page['Reservations'])
+            if not exists:
+                self._unused_names[cache_key] = time.monotonic()
+            return exists
         except ClientError:
             return False
 
+    def _describe_instance(self, instance_id: str) -> Dict:
+        """Return the description of an instance.
+
+        Reuses (once) the description fetched while resolving the identifier
+        when available, otherwise calls describe_instances.
+        """
+        instance = self.resolver.last_instance
+        self.resolver.last_instance = None
+        if instance and instance['InstanceId'] == instance_id:
+            return instance
+
+        response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
+        return response['Reservations'][0]['Instances'][0]
+
     def _resolve_instance_identifier(self, identifier: str, include_terminated: bool = False) -> Optional[str]:
         """Resolve instance identifier to instance ID, searching across regions.
 
@@ -995,10 +1618,10 @@ class AWSInstanceManager:
 
         return result
     
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
     def create_instance(self, profile_name: str, instance_name: str, app_class: str = None,
                        spot_price: float = None, dry_run: bool = False,
-                       availability_zone: str = None, spot_override: bool = None) -> Optional[str]:
+                       availability_zone: str = None, spot_override: bool = None,
+                       wait: bool = True) -> Optional[str]:
         """Create a new EC2 instance based on a profile.
 
         Args:
@@ -1009,22 +1632,29 @@ class AWSInstanceManager:
             dry_run: If True, validate parameters without creating instance
             availability_zone: Specific AZ to launch in (e.g., us-east-1a)
             spot_override: If True, force spot; if False, force on-demand; if None, use profile
+            wait: If False, return right after launch and wait for the instance
+                (and set up SSH) on a background thread
 
         Returns:
             Instance ID if successful, None otherwise
         """
         try:
-            # Check for duplicate instance name
-            if self._instance_name_exists(instance_name):
-                print(f"Error: An instance named '{instance_name}' already exists.")
-                print("Please choose a different name or terminate the existing instance first.")
-                return None
-
-            # Load profile and apply overrides
+            # Load and validate the profile before making any AWS calls
             profile = self.get_profile(profile_name, required=True)
+            try:
+                key_name = self._validate_create_params(profile, profile_name, availability_zone)
+            except ValueError as e:
+                logger.error("Invalid create parameters: %s", e)
+                return None
             if spot_price is not None:
                 profile['spot_price'] = spot_price
 
+            # Check for duplicate instance name
+            if self._instance_name_exists(instance_name):
+                logger.error("An instance named '%s' already exists.", instance_name)
+                logger.error("Please choose a different name or terminate the existing instance first.")
+                return None
+
             # Determine instance configuration
             instance_type = profile.get('instance_type', 't3.micro')
             spot_instance = spot_override if spot_override is not None else profile.get('spot_instance', False)
@@ -1035,19 +1665,12 @@ class AWSInstanceManager:
             if not ami_id:
                 ami_id = self._get_latest_ami(profile.get('os_type', 'ubuntu'), profile.get('ami_name'))
 
-            # Get SSH key
-            key_name = self._get_key_name(profile)
-            if not key_name:
-                print(f"Error: No SSH key configured for region {self.region}.")
-                print("Please configure a key_name in the profile or in regions.yaml")
-                return None
-
             # Get subnet if AZ specified
             subnet_id = profile.get('subnet_id')
             if not subnet_id and availability_zone:
                 subnet_id = self._get_default_vpc_subnet(availability_zone)
                 if not subnet_id:
-                    print(f"Error: No subnet found in availability zone {availability_zone}.")
+                    logger.error("No subnet found in availability zone %s.", availability_zone)
                     return None
 
             # Build run_instances parameters
@@ -1064,76 +1687,157 @@ class AWSInstanceManager:
                 'DryRun': dry_run
             }
 
-            # Add optional parameters
-            if profile.get('security_groups'):
-                run_params['SecurityGroups'] = profile['security_groups']
-            if subnet_id:
-                run_params['SubnetId'] = subnet_id
-            if availability_zone:
-                run_params['Placement'] = {'AvailabilityZone': availability_zone}
-
-            encoded_user_data = self._prepare_user_data(profile)
-            if encoded_user_data:
-                run_params['UserData'] = encoded_user_data
-
-            # Configure spot instance options
-            if spot_instance:
-                run_params['InstanceMarketOptions'] = self._prepare_spot_options(profile, hibernation_enabled)
-
-            # Configure hibernation
-            if hibernation_enabled:
-                run_params['HibernationOptions'] = {'Configured': True}
-
-            if dry_run:
-                print("Dry run successful. Instance parameters are valid.")
-                return None
+            # Add optional parameters, dropping the ones that don't apply
+            optional = {
+                'SecurityGroups': profile.get('security_groups'),
+                'SubnetId': subnet_id,
+                'Placement': {'AvailabilityZone': availability_zone} if availability_zone else None,
+                'UserData': self._prepare_user_data(profile),
+                'InstanceMarketOptions': (self._prepare_spot_options(profile, hibernation_enabled)
+                                          if spot_instance else None),
+                'HibernationOptions': {'Configured': True} if hibernation_enabled else None,
+            }
+            run_params.update((key, value) for key, value in optional.items() if value)
 
             # Log creation details
             self._log_instance_creation(instance_name, profile_name, instance_type, ami_id,
                                         availability_zone, spot_instance, hibernation_enabled,
                                         app_class, profile.get('spot_price'))
 
-            # Create the instance
+            # Create the instance (a dry run is validated by EC2 and raises DryRunOperation)
             response = self.ec2_client.run_instances(**run_params)
             instance_id = response['Instances'][0]['InstanceId']
-            print(f"Instance created successfully: {instance_id}")
+            self._unused_names.pop((self.region, instance_name), None)
+            logger.info("Instance created successfully: %s", instance_id)
 
             # Wait and setup SSH
-            self._wait_for_instance_and_setup_ssh(instance_id, instance_name)
+            if wait:
+                self._wait_for_instance_and_setup_ssh(instance_id, instance_name)
+            else:
+                if self._wait_pool is None:
+                    self._wait_pool = ThreadPoolExecutor(max_workers=8)
+                future = self._wait_pool.submit(
+                    self._wait_for_instance_and_setup_ssh, instance_id, instance_name,
+                    self.ec2_client, self.region
+                )
+                self._pending_waits[instance_id] = future
+                future.add_done_callback(lambda _, iid=instance_id: self._pending_waits.pop(iid, None))
             return instance_id
 
         except ClientError as e:
+            self._invalidate_subnet_cache(e)
             if e.response['Error']['Code'] == 'DryRunOperation':
-                print("Dry run successful. Instance parameters are valid.")
+                logger.info("Dry run successful. Instance parameters are valid.")
                 return None
-            print(f"Error creating instance: {e}")
+            logger.error("Error creating instance: %s", e)
             return None
         except Exception as e:
-            print(f"Unexpected error creating instance: {e}")
+            logger.error("Unexpected error creating instance: %s", e)
             return None
 
+    def _validate_create_params(self, profile: Dict, profile_name: str,
+                                availability_zone: Optional[str]) -> str:
+        """Check a profile against local configuration before launching.
+
+        Only local config is consulted, so misconfigured creates fail without
+        spending any EC2 API calls.
+
+        Args:
+            profile: Profile configuration
+            profile_name: Name of the profile, for error messages
+            availability_zone: Requested availability zone, if any
+
+        Returns:
+            The SSH key name to launch with
+
+        Raises:
+            ValueError: If the profile cannot be used in the current region
+        """
+        if not isinstance(profile, dict):
+            raise ValueError(f"Profile '{profile_name}' is empty or not a mapping.")
+
+        if not profile.get('ami_id'):
+            os_type = profile.get('os_type', 'ubuntu')
+            if os_type not in AMI_FILTERS:
+                raise ValueError(f"Unsupported OS type in profile '{profile_name}': {os_type}. "
+                                 f"Supported: {list(AMI_FILTERS.keys())}")
+
+        if availability_zone and not availability_zone.startswith(self.region):
+            raise ValueError(f"Availability zone {availability_zone} is not in region {self.region}.")
+
+        key_name = self._get_key_name(profile)
+        if not key_name:
+            raise ValueError(f"No SSH key configured for region {self.region}. "
+                             "Please configure a key_name in the profile or in regions.yaml")
+        return key_name
+
+    def create_many(self, profile_name: str, instance_names: List[str],
+                    **kwargs) -> Dict[str, Optional[str]]:
+        """Create several instances from one profile.
+
+        Instances are launched back to back; waiting for them to run and
+        writing their SSH entries happens in the background, so the total
+        time is roughly one wait rather than one per instance.
+
+        Args:
+            profile_name: Name of the profile to use
+            instance_names: Names for the instances
+            **kwargs: Additional create_instance arguments (app_class, spot_price, ...)
+
+        Returns:
+            Dict mapping instance name to instance ID (None if creation failed)
+        """
+        kwargs.pop('wait', None)
+        created = {}
+        futures = []
+        for name in instance_names:
+            instance_id = self.create_instance(profile_name, name, wait=False, **kwargs)
+            created[name] = instance_id
+            # Absent if the wait already finished
+            future = self._pending_waits.get(instance_id) if instance_id else None
+            if future is not None:
+                futures.append(future)
+
+        for future in futures:
+            future.result()
+
+        # Our futures may still be in _pending_waits until their done callbacks
+        # run, so only waits started elsewhere can keep the pool open
+        others = [f for f in list(self._pending_waits.values()) if f not in futures]
+        if all(f.done() for f in others):
+            self.close()
+        return created
+
+    def close(self) -> None:
+        """Wait for background instance waits to finish and release their threads."""
+        if self._wait_pool is not None:
+            self._wait_pool.shutdown(wait=True)
+            self._wait_pool = None
+
     def _log_instance_creation(self, instance_name: str, profile_name: str, instance_type: str,
                                ami_id: str, availability_zone: str, spot_instance: bool,
                                hibernation_enabled: bool, app_class: str, spot_price: float) -> None:
         """Log instance creation details."""
-        print(f"Creating instance: {instance_name}")
-        print(f"  Profile: {profile_name}")
-        print(f"  Instance Type: {instance_type}")
-        print(f"  AMI: {ami_id}")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info("Creating instance: %s", instance_name)
+        logger.info("  Profile: %s", profile_name)
+        logger.info("  Instance Type: %s", instance_type)
+        logger.info("  AMI: %s", ami_id)
         if availability_zone:
-            print(f"  Availability Zone: {availability_zone}")
-        print(f"  Spot Instance: {spot_instance}")
+            logger.info("  Availability Zone: %s", availability_zone)
+        logger.info("  Spot Instance: %s", spot_instance)
         if spot_instance:
             if spot_price:
-                print(f"  Max Spot Price: ${spot_price}/hour")
+                logger.info("  Max Spot Price: $%s/hour", spot_price)
             else:
-                print(f"  Max Spot Price: on-demand (no limit)")
-        print(f"  Hibernation: {hibernation_enabled}")
-        print(f"  Application Class: {app_class or 'None'}")
+                logger.info("  Max Spot Price: on-demand (no limit)")
+        logger.info("  Hibernation: %s", hibernation_enabled)
+        logger.info("  Application Class: %s", app_class or 'None')
     
-    @AWSErrorHandler.retry_on_aws_error(max_retries=2, delay=1.0)
     def list_instances(self, app_class: str = None, state: str = None, 
-                      profile_name: str = None, all_instances: bool = False) -> List[Dict]:
+                      profile_name: str = None, all_instances: bool = False,
+                      all_regions: bool = False) -> List[Dict]:
         """List EC2 instances with optional filtering.
         
         Args:
@@ -1141,135 +1845,244 @@ class AWSInstanceManager:
             state: Filter by instance state
             profile_name: Filter by profile name
             all_instances: If True, show all instances, not just spotman-created ones
+            all_regions: If True, query all configured regions concurrently and
+                add a 'Region' key to each instance
             
         Returns:
             List of instance dictionaries
         """
+        filters = self._build_instance_filters(app_class, state, profile_name, all_instances)
+        
+        if all_regions:
+            regions = list(self.regions_config.get('regions', {}).keys()) or [self.region]
+            # Create clients on this thread: boto3 sessions are not thread-safe, clients are
+            clients = {region: self.ec2_client if region == self.region else _client_for(self.session, region)
+                       for region in regions}
+
+            instances = []
+            with ThreadPoolExecutor(max_workers=min(16, len(regions))) as executor:
+                futures = {executor.submit(self._list_one_region, clients[region], filters): region
+                           for region in regions}
+                for future in as_completed(futures):
+                    region_instances = future.result()
+                    for instance_info in region_instances:
+                        instance_info['Region'] = futures[future]
+                    instances.extend(region_instances)
+        else:
+            instances = self._list_one_region(self.ec2_client, filters)
+        
+        # Sort by launch time (newest first)
+        instances.sort(key=lambda x: x['LaunchTime'], reverse=True)
+        return instances
+
+    @staticmethod
+    def _build_instance_filters(app_class: str = None, state: str = None,
+                                profile_name: str = None, all_instances: bool = False) -> List[Dict]:
+        """Build server-side describe_instances filters.
+
+        Args:
+            app_class: Filter by application class
+            state: Filter by instance state
+            profile_name: Filter by profile name
+            all_instances: If False, only match spotman-created instances
+
+        Returns:
+            List of filters for describe_instances
+        """
+        filters = []
+        
+        if app_class:
+            filters.append({'Name': 'tag:ApplicationClass', 'Values': [app_class]})
+        if state:
+            filters.append({'Name': 'instance-state-name', 'Values': [state]})
+        if profile_name:
+            filters.append({'Name': 'tag:Profile', 'Values': [profile_name]})
+        
+        # Only filter for spotman instances if not showing all instances
+        if not all_instances:
+            filters.append({'Name': 'tag:CreatedBy', 'Values': ['spotman']})
+        
+        return filters
+
+    def _list_one_region(self, ec2_client, filters: List[Dict]) -> List[Dict]:
+        """List instances matching filters using one region's EC2 client.
+
+        Args:
+            ec2_client: EC2 client for the region to query
+            filters: describe_instances filters
+
+        Returns:
+            List of instance dictionaries (unsorted)
+        """
         try:
-            filters = []
-            
-            if app_class:
-                filters.append({'Name': 'tag:ApplicationClass', 'Values': [app_class]})
-            if state:
-                filters.append({'Name': 'instance-state-name', 'Values': [state]})
-            if profile_name:
-                filters.append({'Name': 'tag:Profile', 'Values': [profile_name]})
-            
-            # Only filter for spotman instances if not showing all instances
-            if not all_instances:
-                filters.append({'Name': 'tag:CreatedBy', 'Values': ['spotman']})
-            
-            response = self.ec2_client.describe_instances(Filters=filters)
+            paginator = _paginator_for(ec2_client, 'describe_instances')
+            pages = paginator.paginate(Filters=filters, PaginationConfig={'PageSize': 1000})
             
             instances = []
-            for reservation in response['Reservations']:
+            for reservation in (r for page in pages for r in page['Reservations']):
                 for instance in reservation['Instances']:
+                    tags = {t['Key']: t['Value'] for t in instance.get('Tags', [])}
+
                     # Extract relevant information
-                    instance_info = {
+                    instances.append({
                         'InstanceId': instance['InstanceId'],
-                        'Name': 'N/A',
+                        'Name': tags.get('Name', 'N/A'),
                         'State': instance['State']['Name'],
                         'InstanceType': instance['InstanceType'],
                         'PublicIpAddress': instance.get('PublicIpAddress', 'N/A'),
                         'PrivateIpAddress': instance.get('PrivateIpAddress', 'N/A'),
                         'LaunchTime': instance['LaunchTime'],
-                        'ApplicationClass': 'N/A',
-                        'Profile': 'N/A',
+                        'ApplicationClass': tags.get('ApplicationClass', 'N/A'),
+                        'Profile': tags.get('Profile', 'N/A'),
                         'SpotInstance': 'spot' in instance.get('InstanceLifecycle', ''),
-                        'HibernationEnabled': False
-                    }
-                    
-                    # Extract tags
-                    for tag in instance.get('Tags', []):
-                        if tag['Key'] == 'Name':
-                            instance_info['Name'] = tag['Value']
-                        elif tag['Key'] == 'ApplicationClass':
-                            instance_info['ApplicationClass'] = tag['Value']
-                        elif tag['Key'] == 'Profile':
-                            instance_info['Profile'] = tag['Value']
-                        elif tag['Key'] == 'HibernationEnabled':
-                            instance_info['HibernationEnabled'] = tag['Value'].lower() == 'true'
-                    
-                    instances.append(instance_info)
+                        'HibernationEnabled': tags.get('HibernationEnabled', '').lower() == 'true'
+                    })
             
-            # Sort by launch time (newest first)
-            instances.sort(key=lambda x: x['LaunchTime'], reverse=True)
             return instances
             
         except ClientError as e:
-            print(f"Error listing instances: {e}")
+            logger.error("Error listing instances: %s", e)
             return []
     
-    def _simple_instance_action(self, instance_identifier: str, action: str,
-                                 ec2_method: str, **kwargs) -> bool:
-        """Execute a simple instance action (start/stop).
+    def _region_client(self, region: str):
+        """Return the EC2 client for a region, reusing the manager's own client."""
+        return self.ec2_client if region == self.region else _client_for(self.session, region)
+
+    def _resolve_instance_identifiers(self, identifiers: List[str]) -> Dict[str, List[Tuple[str, str]]]:
+        """Resolve several instance identifiers, grouped by region.
+
+        Repeated identifiers are resolved once. A single identifier goes
+        through the manager's resolver (switching region as usual); several
+        are resolved together by InstanceResolver.resolve_many.
 
         Args:
-            instance_identifier: Instance name or ID
+            identifiers: Instance names or IDs
+
+        Returns:
+            Dict mapping region to a list of (identifier, instance_id) pairs.
+            Identifiers that could not be resolved are left out.
+        """
+        identifiers = list(dict.fromkeys(identifiers))
+        if len(identifiers) == 1:
+            instance_id = self._resolve_instance_identifier(identifiers[0])
+            return {self.region: [(identifiers[0], instance_id)]} if instance_id else {}
+
+        by_region: Dict[str, List[Tuple[str, str]]] = {}
+        for identifier, (region, instance_id) in self.resolver.resolve_many(identifiers).items():
+            by_region.setdefault(region, []).append((identifier, instance_id))
+        return by_region
+
+    def _describe_instances_by_id(self, ec2_client, instance_ids: List[str]) -> List[Dict]:
+        """Describe instances by ID, reusing the resolver's description when possible."""
+        if len(instance_ids) == 1 and ec2_client is self.ec2_client:
+            return [self._describe_instance(instance_ids[0])]
+
+        instances = []
+        for batch in _chunks(instance_ids, 200):
+            response = ec2_client.describe_instances(InstanceIds=batch)
+            instances.extend(i for r in response['Reservations'] for i in r['Instances'])
+        return instances
+
+    def _batch_instance_action(self, instance_identifiers: List[str], action: str,
+                               ec2_method: str, **kwargs) -> bool:
+        """Execute a simple instance action (start/stop) on several instances.
+
+        Instances are grouped by region and sent in batches of up to 1000 IDs
+        per API call.
+
+        Args:
+            instance_identifiers: Instance names or IDs
             action: Action name for logging (e.g., "Starting", "Stopping")
             ec2_method: EC2 client method name to call
             **kwargs: Additional arguments for the EC2 method
 
         Returns:
-            True if successful, False otherwise
+            True if every instance was resolved and every request succeeded
         """
-        instance_id = self._resolve_instance_identifier(instance_identifier)
-        if not instance_id:
-            return False
+        by_region = self._resolve_instance_identifiers(instance_identifiers)
+        success = sum(len(targets) for targets in by_region.values()) == len(set(instance_identifiers))
 
-        try:
-            print(f"{action} instance: {instance_identifier} ({instance_id})")
-            method = getattr(self.ec2_client, ec2_method)
-            method(InstanceIds=[instance_id], **kwargs)
-            print(f"✅ {action.rstrip('ing')} request sent successfully.")
-            return True
-        except ClientError as e:
-            print(f"Error {action.lower()} instance: {e}")
-            return False
+        for region, targets in by_region.items():
+            method = getattr(self._region_client(region), ec2_method)
+            for batch in _chunks(targets, 1000):
+                try:
+                    for identifier, instance_id in batch:
+                        print(f"{action} instance: {identifier} ({instance_id})")
+                    method(InstanceIds=list(dict.fromkeys(instance_id for _, instance_id in batch)), **kwargs)
+                    print(f"{ICON['ok']} {action.rstrip('ing')} request sent successfully.")
+                except ClientError as e:
+                    logger.error("Error %s instance: %s", action.lower(), e)
+                    success = False
+
+        return success
+
+    def stop_instances(self, instance_identifiers: List[str]) -> bool:
+        """Stop several EC2 instances, batching API calls per region."""
+        return self._batch_instance_action(instance_identifiers, "Stopping", "stop_instances")
+
+    def start_instances(self, instance_identifiers: List[str]) -> bool:
+        """Start several EC2 instances, batching API calls per region."""
+        return self._batch_instance_action(instance_identifiers, "Starting", "start_instances")
+
+    def terminate_instances(self, instance_identifiers: List[str]) -> bool:
+        """Terminate several EC2 instances and cancel any associated spot requests.
+
+        Instances are grouped by region and sent in batches of up to 1000 IDs
+        per API call.
+
+        Returns:
+            True if every instance was resolved and every request succeeded
+        """
+        by_region = self._resolve_instance_identifiers(instance_identifiers)
+        success = sum(len(targets) for targets in by_region.values()) == len(set(instance_identifiers))
+
+        for region, targets in by_region.items():
+            ec2_client = self._region_client(region)
+            for batch in _chunks(targets, 1000):
+                instance_ids = list(dict.fromkeys(instance_id for _, instance_id in batch))
+                try:
+                    instances = self._describe_instances_by_id(ec2_client, instance_ids)
+                    spot_request_ids = [inst['SpotInstanceRequestId'] for inst in instances
+                                        if inst.get('SpotInstanceRequestId')]
+
+                    # Cancel spot requests first: a persistent request still open when its
+                    # instance terminates would launch a replacement
+                    if spot_request_ids:
+                        print(f"Cancelling spot request: {', '.join(spot_request_ids)}")
+                        try:
+                            ec2_client.cancel_spot_instance_requests(
+                                SpotInstanceRequestIds=spot_request_ids
+                            )
+                            print(f"{ICON['ok']} Spot request cancelled.")
+                        except ClientError as e:
+                            logger.warning("Could not cancel spot request: %s", e)
+
+                    for identifier, instance_id in batch:
+                        print(f"Terminating instance: {identifier} ({instance_id})")
+                    print(f"{ICON['warn']}  This action cannot be undone!")
+                    ec2_client.terminate_instances(InstanceIds=instance_ids)
+
+                    for instance_id in instance_ids:
+                        self.resolver.invalidate(instance_id)
+                    print(f"{ICON['ok']} Termination request sent successfully.")
+                except ClientError as e:
+                    logger.error("Error terminating instance: %s", e)
+                    success = False
+
+        return success
 
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
     def stop_instance(self, instance_identifier: str) -> bool:
         """Stop an EC2 instance."""
-        return self._simple_instance_action(instance_identifier, "Stopping", "stop_instances")
+        return self.stop_instances([instance_identifier])
 
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
     def start_instance(self, instance_identifier: str) -> bool:
         """Start an EC2 instance."""
-        return self._simple_instance_action(instance_identifier, "Starting", "start_instances")
+        return self.start_instances([instance_identifier])
 
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
     def terminate_instance(self, instance_identifier: str) -> bool:
         """Terminate an EC2 instance and cancel any associated spot request."""
-        instance_id = self._resolve_instance_identifier(instance_identifier)
-        if not instance_id:
-            return False
-
-        try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            instance = response['Reservations'][0]['Instances'][0]
-
-            # Cancel spot request if present
-            spot_request_id = instance.get('SpotInstanceRequestId')
-            if spot_request_id:
-                print(f"Cancelling spot request: {spot_request_id}")
-                try:
-                    self.ec2_client.cancel_spot_instance_requests(
-                        SpotInstanceRequestIds=[spot_request_id]
-                    )
-                    print("✅ Spot request cancelled.")
-                except ClientError as e:
-                    print(f"Warning: Could not cancel spot request: {e}")
-
-            print(f"Terminating instance: {instance_identifier} ({instance_id})")
-            print("⚠️  This action cannot be undone!")
-            self.ec2_client.terminate_instances(InstanceIds=[instance_id])
-            print("✅ Termination request sent successfully.")
-            return True
-        except ClientError as e:
-            print(f"Error terminating instance: {e}")
-            return False
+        return self.terminate_instances([instance_identifier])
 
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
     def hibernate_instance(self, instance_identifier: str) -> bool:
         """Hibernate an EC2 instance."""
         instance_id = self._resolve_instance_identifier(instance_identifier)
@@ -1277,30 +2090,28 @@ class AWSInstanceManager:
             return False
 
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            instance = response['Reservations'][0]['Instances'][0]
+            instance = self._describe_instance(instance_id)
 
             if not instance.get('HibernateOptions', {}).get('Configured', False):
-                print("Error: Hibernation is not enabled for this instance.")
+                logger.error("Hibernation is not enabled for this instance.")
                 return False
 
             if instance['State']['Name'] != 'running':
-                print(f"Error: Instance is not running (current state: {instance['State']['Name']}).")
+                logger.error("Instance is not running (current state: %s).", instance['State']['Name'])
                 return False
 
             print(f"Hibernating instance: {instance_identifier} ({instance_id})")
             self.ec2_client.stop_instances(InstanceIds=[instance_id], Hibernate=True)
-            print("✅ Hibernation request sent successfully.")
-            print("💡 Instance state and memory will be preserved.")
+            print(f"{ICON['ok']} Hibernation request sent successfully.")
+            print(f"{ICON['tip']} Instance state and memory will be preserved.")
             return True
         except ClientError as e:
             if e.response.get('Error', {}).get('Code') == 'UnsupportedOperation':
-                print("Error: Hibernation is not supported for this instance type.")
+                logger.error("Hibernation is not supported for this instance type.")
             else:
-                print(f"Error hibernating instance: {e}")
+                logger.error("Error hibernating instance: %s", e)
             return False
 
-    @AWSErrorHandler.retry_on_aws_error(max_retries=3, delay=2.0)
     def resume_hibernated_instance(self, instance_identifier: str) -> bool:
         """Resume a hibernated EC2 instance."""
         instance_id = self._resolve_instance_identifier(instance_identifier)
@@ -1308,23 +2119,22 @@ class AWSInstanceManager:
             return False
 
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            current_state = response['Reservations'][0]['Instances'][0]['State']['Name']
+            current_state = self._describe_instance(instance_id)['State']['Name']
 
             if current_state == 'running':
                 print(f"Instance {instance_identifier} is already running.")
                 return True
             if current_state != 'stopped':
-                print(f"Error: Instance is not stopped (current state: {current_state}).")
+                logger.error("Instance is not stopped (current state: %s).", current_state)
                 return False
 
             print(f"Resuming instance: {instance_identifier} ({instance_id})")
             self.ec2_client.start_instances(InstanceIds=[instance_id])
-            print("✅ Resume request sent successfully.")
-            print("💡 Instance will restore from hibernated state.")
+            print(f"{ICON['ok']} Resume request sent successfully.")
+            print(f"{ICON['tip']} Instance will restore from hibernated state.")
             return True
         except ClientError as e:
-            print(f"Error resuming instance: {e}")
+            logger.error("Error resuming instance: %s", e)
             return False
 
     def check_hibernation_status(self, instance_identifier: str) -> None:
@@ -1338,8 +2148,7 @@ class AWSInstanceManager:
             return
         
         try:
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            instance = response['Reservations'][0]['Instances'][0]
+            instance = self._describe_instance(instance_id)
             
             hibernation_options = instance.get('HibernateOptions', {})
             hibernation_enabled = hibernation_options.get('Configured', False)
@@ -1348,27 +2157,27 @@ class AWSInstanceManager:
             
             print(f"\nHibernation Status for {instance_identifier}:")
             print(f"  Instance ID: {instance_id}")
-            print(f"  Hibernation Enabled: {'✅ Yes' if hibernation_enabled else '❌ No'}")
+            print(f"  Hibernation Enabled: {ICON['ok'] + ' Yes' if hibernation_enabled else ICON['error'] + ' No'}")
             print(f"  Current State: {current_state}")
             print(f"  State Reason: {state_reason}")
             
             if hibernation_enabled:
                 if current_state == 'stopped' and 'hibernation' in state_reason.lower():
-                    print("  Status: 🛏️  Instance is hibernated")
-                    print("  💡 Use 'resume' command to restore from hibernation")
+                    print(f"  Status: {ICON['hibernated']}  Instance is hibernated")
+                    print(f"  {ICON['tip']} Use 'resume' command to restore from hibernation")
                 elif current_state == 'running':
-                    print("  Status: 🟢 Instance is running")
-                    print("  💡 Use 'hibernate' command to hibernate this instance")
+                    print(f"  Status: {ICON['running']} Instance is running")
+                    print(f"  {ICON['tip']} Use 'hibernate' command to hibernate this instance")
                 elif current_state == 'stopped':
-                    print("  Status: 🔴 Instance is stopped (not hibernated)")
-                    print("  💡 Use 'start' command to start normally")
+                    print(f"  Status: {ICON['stopped']} Instance is stopped (not hibernated)")
+                    print(f"  {ICON['tip']} Use 'start' command to start normally")
                 else:
-                    print(f"  Status: 🟡 Instance is in {current_state} state")
+                    print(f"  Status: {ICON['other']} Instance is in {current_state} state")
             else:
-                print("  💡 To enable hibernation, use a profile with 'hibernation_enabled: true'")
+                print(f"  {ICON['tip']} To enable hibernation, use a profile with 'hibernation_enabled: true'")
             
         except ClientError as e:
-            print(f"Error checking hibernation status: {e}")
+            logger.error("Error checking hibernation status: %s", e)
 
     def get_spot_instance_status(self, instance_identifier: str) -> None:
         """Get spot instance status and interruption information.
@@ -1382,8 +2191,7 @@ class AWSInstanceManager:
 
         try:
             # Get instance details
-            response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-            instance = response['Reservations'][0]['Instances'][0]
+            instance = self._describe_instance(instance_id)
 
             instance_type = instance.get('InstanceType', 'N/A')
             current_state = instance['State']['Name']
@@ -1402,11 +2210,11 @@ class AWSInstanceManager:
                 print(f"  State Reason: {state_reason.get('Code', 'N/A')} - {state_reason.get('Message', 'N/A')}")
 
             if lifecycle != 'spot':
-                print("\n  ℹ️  This is not a spot instance.")
+                print(f"\n  {ICON['info']}  This is not a spot instance.")
                 return
 
             if not spot_instance_request_id:
-                print("\n  ⚠️  No spot instance request ID found.")
+                print(f"\n  {ICON['warn']}  No spot instance request ID found.")
                 return
 
             print(f"  Spot Request ID: {spot_instance_request_id}")
@@ -1439,66 +2247,101 @@ class AWSInstanceManager:
                 print(f"\nInterpretation:")
                 if status_code in SPOT_STATUS_MESSAGES:
                     icon, message = SPOT_STATUS_MESSAGES[status_code]
-                    print(f"  {icon} {message}")
+                    print(f"  {icon if _EMOJI_OUTPUT else ICON['info']} {message}")
                 elif 'bad-parameters' in status_code:
-                    print("  ❌ Bad parameters in spot request")
+                    print(f"  {ICON['error']} Bad parameters in spot request")
                 else:
-                    print(f"  ℹ️  Status: {status_code}")
+                    print(f"  {ICON['info']}  Status: {status_code}")
 
         except ClientError as e:
-            print(f"Error getting spot instance status: {e}")
+            logger.error("Error getting spot instance status: %s", e)
+
+    @staticmethod
+    def _ssh_job(instance: Dict, region: str = None) -> Tuple[str, str, Dict]:
+        """Project an instance description down to what an SSH entry needs.
 
-    def update_ssh_config(self, instance_id: str = None, profile_name: str = None, app_class: str = None):
+        Keeping only these fields lets each page's full reservation payload
+        be freed as soon as it has been read.
+
+        Args:
+            instance: Instance description from describe_instances
+            region: Region the instance lives in, if not the manager's region
+
+        Returns:
+            (instance_id, host_name, lean instance dict) for _add_ssh_config_entry
+        """
+        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', ())}
+        lean = {key: instance[key] for key in ('PublicIpAddress', 'KeyName', 'Tags') if key in instance}
+        if region:
+            lean['Region'] = region
+        return instance['InstanceId'], f"spotman-{tags.get('Name', 'unknown')}", lean
+
+    def _ssh_jobs_in_region(self, ec2_client, filters: List[Dict],
+                            region: str = None) -> List[Tuple[str, str, Dict]]:
+        """Describe matching instances in one region as SSH jobs."""
+        paginator = _paginator_for(ec2_client, 'describe_instances')
+        pages = paginator.paginate(Filters=filters, PaginationConfig={'PageSize': 1000})
+        return [self._ssh_job(i, region) for page in pages for r in page['Reservations'] for i in r['Instances']]
+
+    def update_ssh_config(self, instance_id: Union[str, List[str], None] = None,
+                          profile_name: str = None, app_class: str = None,
+                          all_regions: bool = False):
         """Update SSH configuration for instances.
         
         Args:
-            instance_id: Specific instance ID to update
+            instance_id: Specific instance ID (or list of IDs) to update
             profile_name: Update instances with this profile
             app_class: Update instances with this application class
+            all_regions: If True, look up matching instances in all configured
+                regions concurrently (ignored when instance_id is given)
         """
         try:
-            instances = []
+            jobs = self._collect_ssh_jobs(instance_id, profile_name, app_class, all_regions)
+        except (ClientError, BotoCoreError) as e:
+            # Throttling and transient errors were already retried by the client
+            logger.error("Error updating SSH config: %s", e)
+            return
+        
+        if not jobs:
+            print("No running instances found matching the criteria.")
+            return
+        
+        print(f"Updating SSH config for {len(jobs)} instance(s)...")
+        
+        self._add_ssh_config_entries(jobs)
+
+    def _collect_ssh_jobs(self, instance_id: Union[str, List[str], None], profile_name: Optional[str],
+                          app_class: Optional[str], all_regions: bool) -> List[Tuple[str, str, Dict]]:
+        """Describe the instances update_ssh_config should write entries for.
+
+        Returns:
+            SSH jobs as built by _ssh_job
+        """
+        jobs = []
+        
+        if instance_id:
+            # Update specific instances, staying under the per-call InstanceIds limit
+            instance_ids = [instance_id] if isinstance(instance_id, str) else list(instance_id)
+            for batch in _chunks(instance_ids, 200):
+                response = self.ec2_client.describe_instances(InstanceIds=batch)
+                jobs.extend(self._ssh_job(i) for r in response.get('Reservations', ())
+                            for i in r.get('Instances', ()))
+        else:
+            # Only named instances get a meaningful host alias, so let EC2 drop the rest
+            filters = self._build_instance_filters(app_class, 'running', profile_name)
+            filters.append({'Name': 'tag-key', 'Values': ['Name']})
             
-            if instance_id:
-                # Update specific instance
-                response = self.ec2_client.describe_instances(InstanceIds=[instance_id])
-                if response['Reservations']:
-                    instances = response['Reservations'][0]['Instances']
+            if all_regions:
+                regions = list(self.regions_config.get('regions', {}).keys()) or [self.region]
+                # Create clients on this thread: boto3 sessions are not thread-safe, clients are
+                clients = {region: self._region_client(region) for region in regions}
+                # At most 8 regions in flight to stay clear of EC2 request throttling
+                with ThreadPoolExecutor(max_workers=min(8, len(regions))) as executor:
+                    for region_jobs in executor.map(
+                            lambda region: self._ssh_jobs_in_region(clients[region], filters, region),
+                            regions):
+                        jobs.extend(region_jobs)
             else:
-                # Build filters
-                filters = [
-                    {'Name': 'instance-state-name', 'Values': ['running']},
-                    {'Name': 'tag:CreatedBy', 'Values': ['spotman']}
-                ]
-                
-                if profile_name:
-                    filters.append({'Name': 'tag:Profile', 'Values': [profile_name]})
-                if app_class:
-                    filters.append({'Name': 'tag:ApplicationClass', 'Values': [app_class]})
-                
-                # Get all matching instances
-                response = self.ec2_client.describe_instances(Filters=filters)
-                for reservation in response['Reservations']:
-                    instances.extend(reservation['Instances'])
-            
-            if not instances:
-                print("No running instances found matching the criteria.")
-                return
-            
-            print(f"Updating SSH config for {len(instances)} instance(s)...")
-            
-            for instance in instances:
-                instance_id = instance['InstanceId']
-                instance_name = 'unknown'
-                
-                # Get instance name from tags
-                for tag in instance.get('Tags', []):
-                    if tag['Key'] == 'Name':
-                        instance_name = tag['Value']
-                        break
-                
-                host_name = f"spotman-{instance_name}"
-                self._add_ssh_config_entry(instance_id, host_name)
-                
-        except Exception as e:
-            print(f"Error updating SSH config: {e}")
\ No newline at end of file
+                jobs = self._ssh_jobs_in_region(self.ec2_client, filters)
+        
+        return jobs
\ No newline at end of file